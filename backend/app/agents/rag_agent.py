@@ -1,26 +1,39 @@
-from typing import Dict, Any, List
-from app.services.embeddings import EmbeddingService
+from typing import Dict, Any, List, Optional
+import asyncio
+from app.services.embeddings import get_embedding_service
 from app.models.db import get_db
 
+# App-level filter keys that map onto metadata stored with each Pinecone vector,
+# with the type ingestion stores them as (a mismatched type silently matches nothing)
+FILTERABLE_METADATA_KEYS = {"mime_type": str, "document_id": int, "filename": str}
+
+class InvalidFilterError(ValueError):
+    """Raised when a query's filters can't be translated to a vector-store filter"""
+
 class RAGAgent:
     """
     Retrieves context from Pinecone + Postgres and generates responses
     """
     
     def __init__(self):
-        self.embedding_service = EmbeddingService()
+        self.embedding_service = get_embedding_service()
     
     async def process(self, query: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Process query using RAG approach
         """
-        # Generate query embedding
-        query_embedding = await self.embedding_service.embed_text(query)
+        # Validate filters before paying for the embedding call
+        metadata_filter = self._build_metadata_filter((context or {}).get("filters"))
+        
+        # Generate query embedding (blocking OpenAI call, so run it off the event loop)
+        query_embedding = await asyncio.to_thread(self.embedding_service.embed_query, query)
         
         # Retrieve relevant chunks from Pinecone
-        relevant_chunks = await self.embedding_service.search_similar(
+        relevant_chunks = await asyncio.to_thread(
+            self.embedding_service.search_similar,
             query_embedding, 
-            top_k=5
+            top_k=5,
+            filter=metadata_filter
         )
         
         # Build context from retrieved chunks
@@ -36,6 +49,41 @@ class RAGAgent:
             "context_used": context_text
         }
     
+    def _build_metadata_filter(self, filters: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Translate app-level filters into a Pinecone metadata filter.
+
+        Only keys in FILTERABLE_METADATA_KEYS are accepted, with values of the
+        key's type; a single value matches exactly and a list matches any of its values.
+        """
+        if not filters:
+            return None
+        if not isinstance(filters, dict):
+            raise InvalidFilterError("filters must be an object")
+        
+        unknown = sorted(set(filters) - set(FILTERABLE_METADATA_KEYS))
+        if unknown:
+            raise InvalidFilterError(
+                f"Unsupported filter keys: {', '.join(unknown)}. "
+                f"Allowed: {', '.join(FILTERABLE_METADATA_KEYS)}"
+            )
+        
+        def is_valid(value: Any, expected_type: type) -> bool:
+            # bool is a subclass of int but never a valid document_id
+            return isinstance(value, expected_type) and not isinstance(value, bool)
+        
+        conditions = {}
+        for key, value in filters.items():
+            expected_type = FILTERABLE_METADATA_KEYS[key]
+            if isinstance(value, list) and value and all(is_valid(v, expected_type) for v in value):
+                conditions[key] = {"$in": value}
+            elif is_valid(value, expected_type):
+                conditions[key] = {"$eq": value}
+            else:
+                type_name = "integer" if expected_type is int else "string"
+                raise InvalidFilterError(f"Filter '{key}' must be a {type_name} or a non-empty list of {type_name}s")
+        return conditions
+    
     def _build_context(self, chunks: List[Dict[str, Any]]) -> str:
         """Build context string from retrieved chunks"""
         # TODO: Implement context building logic
@@ -1,20 +1,26 @@
 from typing import Dict, Any, List
+from functools import lru_cache
 import re
 
+# Keyword indicators, in priority order (SQL wins over Pandas)
+SQL_KEYWORDS = ['select', 'from', 'where', 'join', 'group by', 'order by']
+PANDAS_KEYWORDS = ['analyze', 'plot', 'chart', 'graph', 'statistics', 'correlation']
+
+@lru_cache(maxsize=1024)
 def classify_query(query: str) -> str:
     """
     Classify query type to determine which agent to use
+
+    Results are memoized by query text since repeated prompts are common
     """
     query_lower = query.lower()
     
     # Check for SQL indicators
-    sql_keywords = ['select', 'from', 'where', 'join', 'group by', 'order by']
-    if any(keyword in query_lower for keyword in sql_keywords):
+    if any(keyword in query_lower for keyword in SQL_KEYWORDS):
         return "sql"
     
     # Check for Pandas/data analysis indicators
-    pandas_keywords = ['analyze', 'plot', 'chart', 'graph', 'statistics', 'correlation']
-    if any(keyword in query_lower for keyword in pandas_keywords):
+    if any(keyword in query_lower for keyword in PANDAS_KEYWORDS):
         return "pandas"
     
     # Default to RAG for general questions
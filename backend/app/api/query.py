@@ -1,6 +1,7 @@
 from fastapi import APIRouter, HTTPException
 from app.schemas.query import QueryRequest, QueryResponse
 from app.agents.supervisor import Supervisor
+from app.agents.rag_agent import InvalidFilterError
 
 router = APIRouter()
 
@@ -18,5 +19,7 @@ async def query_data(request: QueryRequest):
             "type": result.get("type", "unknown"),  # unknown is a fallback if not present
             "sources": result.get("sources"),
         }
+    except InvalidFilterError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -44,6 +44,9 @@ class Settings(BaseSettings):
     # Security
     SECRET_KEY: str = "your-secret-key-here"
 
+    # Logging (empty disables the file handler)
+    LOG_FILE: str = ""
+
     class Config:
         env_file = "../.env"
 
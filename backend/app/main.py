@@ -2,6 +2,9 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api import query, files, ingest, health
 from app.config import settings
+from app.utils.logging import setup_logging
+
+setup_logging()
 
 app = FastAPI(
     title="LabVerse API",
@@ -17,4 +17,4 @@ class Dataset(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationships
-    source_file = relationship("Document", back_populates="datasets")
+    source_file = relationship("Document")
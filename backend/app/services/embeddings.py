@@ -1,8 +1,43 @@
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Iterator, Optional, Sequence, Tuple
+from functools import lru_cache
+import logging
 import openai
 from pinecone import Pinecone
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+# OpenAI accepts at most 2048 inputs and 300k tokens per embeddings request;
+# token estimates are rough, so keep headroom under the hard cap
+EMBEDDING_BATCH_SIZE = 2048
+EMBEDDING_BATCH_TOKEN_BUDGET = 250_000
+
+# Query embeddings are deterministic for a given model, so repeated queries
+# (retries, clarifications) reuse the cached vector instead of calling OpenAI
+QUERY_EMBEDDING_CACHE_SIZE = 256
+
+def _estimate_tokens(text: str) -> int:
+    """Conservative token count for batching (1 token ≈ 2 chars)"""
+    # Prose runs ~4 chars/token, but parsed markdown full of tables and numbers
+    # is often 2-3; over-estimating only costs extra requests, while
+    # under-estimating pushes a batch past the cap and fails the whole document
+    return len(text) // 2 + 1
+
+def _iter_embedding_batches(texts: List[str]) -> Iterator[List[str]]:
+    """Split texts into request-sized batches bounded by input count and estimated tokens"""
+    batch: List[str] = []
+    batch_tokens = 0
+    for text in texts:
+        tokens = _estimate_tokens(text)
+        if batch and (len(batch) >= EMBEDDING_BATCH_SIZE or batch_tokens + tokens > EMBEDDING_BATCH_TOKEN_BUDGET):
+            yield batch
+            batch, batch_tokens = [], 0
+        batch.append(text)
+        batch_tokens += tokens
+    if batch:
+        yield batch
+
 class EmbeddingService:
     """
     Wrapper for embedding generation + Pinecone indexing
@@ -20,6 +55,8 @@ class EmbeddingService:
         else:
             self.pinecone = None
             self.index = None
+        # Per-instance LRU; the service itself is shared via get_embedding_service()
+        self._embed_query_cached = lru_cache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)(self._embed_query)
 
     def embed_text(self, text: str) -> Tuple[List[float], str]:
         """
@@ -27,21 +64,39 @@ class EmbeddingService:
         """
         response = self.openai_client.embeddings.create(
             input=text,
-            model="text-embedding-3-small"
+            model=EMBEDDING_MODEL
         )
         # The response.data is a list of embedding objects; get the first one
         embedding = response.data[0].embedding
         return (embedding, text)
 
+    def embed_query(self, query: str) -> Tuple[float, ...]:
+        """
+        Embed a search query, serving repeats from a bounded LRU cache.
+
+        Returns an immutable tuple since cached vectors are shared between callers.
+        """
+        return self._embed_query_cached(query)
+
+    def _embed_query(self, query: str) -> Tuple[float, ...]:
+        embedding, _ = self.embed_text(query)
+        return tuple(embedding)
+
     def embed_batch(self, texts: List[str]) -> List[Tuple[List[float], str]]:
-        print("embedding batch")
-        embeddings = []
-        for text in texts:
-            embedding = self.embed_text(text)
-            embeddings.append(embedding)
-            print("embedded text", text)
-        print("done embedding batch")
-        return embeddings
+        # Embed each distinct text once, in as few requests as the API limits allow,
+        # then fan results back out in input order
+        unique_texts = list(dict.fromkeys(texts))
+        unique_embeddings = {}
+        for batch in _iter_embedding_batches(unique_texts):
+            response = self.openai_client.embeddings.create(
+                input=batch,
+                model=EMBEDDING_MODEL
+            )
+            for item in response.data:
+                unique_embeddings[batch[item.index]] = item.embedding
+            logger.debug("Embedded batch of %d texts", len(batch))
+        logger.info("Embedded %d texts (%d unique)", len(texts), len(unique_texts))
+        return [(unique_embeddings[text], text) for text in texts]
 
     def store_embeddings(self, embeddings: List[Dict[str, Any]]):
         # enumerate for vector id order, change to doc_id: index later
@@ -54,23 +109,29 @@ class EmbeddingService:
                 "metadata": {"text": embedding[1]}
             })
         try:
-            print("upserting embeddings")
+            logger.info("Upserting %d embeddings", len(vectors))
             count += 1
             self.index.upsert(vectors=vectors)
         except Exception as e:
-            print(f"Error during Pinecone upsert: {e}")
+            logger.error("Error during Pinecone upsert: %s", e)
 
-    def search_similar(self, query_embedding: List[float], top_k: int = 5) -> List[Dict[str, Any]]:
-        """Search for similar embeddings in Pinecone"""
+    def search_similar(self, query_embedding: Sequence[float], top_k: int = 5, filter: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Search for similar embeddings in Pinecone.
+
+        `filter` is a Pinecone metadata filter (e.g. {"mime_type": {"$eq": "text/plain"}})
+        applied server-side, so excluded vectors never count against top_k.
+        """
         if not self.index:
             raise ValueError("Pinecone index is not initialized.")
         try:
             response = self.index.query(
-                vector=query_embedding,
+                vector=list(query_embedding),
                 top_k=top_k,
+                filter=filter,
                 include_metadata=True
             )
-            print("length of response", len(response['matches']))
+            logger.debug("Pinecone returned %d matches", len(response['matches']))
             # Each match in response['matches'] contains 'id', 'score', and 'metadata'
             results = []
             for match in response['matches']:
@@ -81,5 +142,10 @@ class EmbeddingService:
                 })
             return results
         except Exception as e:
-            print(f"Error during Pinecone similarity search: {e}")
+            logger.error("Error during Pinecone similarity search: %s", e)
             return []
+
+@lru_cache(maxsize=1)
+def get_embedding_service() -> EmbeddingService:
+    """Shared EmbeddingService, so the OpenAI and Pinecone clients are created once per process"""
+    return EmbeddingService()
@@ -1,9 +1,12 @@
 from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
 from landingai_ade import LandingAIADE
+import asyncio
 import mimetypes
+import os
+import tempfile
 from pathlib import Path
-from app.services.embeddings import EmbeddingService
+from app.services.embeddings import get_embedding_service
 from app.services.storage import StorageService
 from app.models.documents import Document
 from app.models.chunks import Chunk
@@ -13,7 +16,7 @@ class IngestionService:
     
     def __init__(self, db: Session):
         self.db = db
-        self.embedding_service = EmbeddingService()
+        self.embedding_service = get_embedding_service()
         self.storage_service = StorageService()
         self.landingai_client = LandingAIADE(apikey=settings.LANDINGAI_API_KEY)
     
@@ -62,9 +65,6 @@ class IngestionService:
     
     async def _parse_with_landingai(self, content: bytes) -> List[Dict[str, Any]]:
         
-        import tempfile
-        import os
-        
         with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
             tmp_file.write(content)
             tmp_path = tmp_file.name
@@ -138,42 +138,54 @@ class IngestionService:
         
         vectors = []
         
-        for chunk in chunks:
-            enriched_text = self._enrich_chunk_text(chunk, document)
-            
-            embedding, _ = self.embedding_service.embed_text(enriched_text)
-            
-            pinecone_id = f"doc_{document.id}_chunk_{chunk.id}"
+        # Read document and chunk attributes once, shared by the enrichment and metadata steps
+        document_id = document.id
+        filename = document.filename
+        mime_type = document.mime_type
+        chunk_fields = [
+            (chunk, chunk.id, chunk.content, chunk.chunk_index, chunk.page_number)
+            for chunk in chunks
+        ]
+        
+        # Embed all chunks of the document in one batched request (blocking OpenAI call, so run it off the event loop)
+        enriched_texts = [
+            self._enrich_chunk_text(filename, content, page_number)
+            for _, _, content, _, page_number in chunk_fields
+        ]
+        embeddings = await asyncio.to_thread(self.embedding_service.embed_batch, enriched_texts)
+        
+        for (chunk, chunk_id, content, chunk_index, page_number), (embedding, _) in zip(chunk_fields, embeddings):
+            pinecone_id = f"doc_{document_id}_chunk_{chunk_id}"
             chunk.pinecone_id = pinecone_id
             
-            preview = chunk.content[:200] + "..." if len(chunk.content) > 200 else chunk.content
+            preview = content[:200] + "..." if len(content) > 200 else content
             
             vector = {
                 "id": pinecone_id,
                 "values": embedding,
                 "metadata": {
-                    "chunk_id": chunk.id,
-                    "document_id": document.id,
-                    "filename": document.filename,
-                    "chunk_index": chunk.chunk_index,
-                    "page_number": chunk.page_number,
+                    "chunk_id": chunk_id,
+                    "document_id": document_id,
+                    "filename": filename,
+                    "chunk_index": chunk_index,
+                    "page_number": page_number,
                     "content_preview": preview,
-                    "mime_type": document.mime_type
+                    "mime_type": mime_type
                 }
             }
             vectors.append(vector)
         
         if vectors:
-            self.embedding_service.index.upsert(vectors=vectors)
+            await asyncio.to_thread(self.embedding_service.index.upsert, vectors=vectors)
     
-    def _enrich_chunk_text(self, chunk: Chunk, document: Document) -> str:
+    def _enrich_chunk_text(self, filename: str, content: str, page_number: Optional[int]) -> str:
         
-        parts = [f"Document: {document.filename}"]
+        parts = [f"Document: {filename}"]
         
-        if chunk.page_number:
-            parts.append(f"Page: {chunk.page_number}")
+        if page_number:
+            parts.append(f"Page: {page_number}")
         
-        parts.append(f"Content: {chunk.content}")
+        parts.append(f"Content: {content}")
         
         return " | ".join(parts)
     
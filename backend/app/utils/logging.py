@@ -4,15 +4,17 @@ from app.config import settings
 
 def setup_logging():
     """Setup application logging"""
+    handlers = [logging.StreamHandler(sys.stdout)]
+    # File logging is opt-in via LOG_FILE so the server doesn't write an unrotated log by default
+    if settings.LOG_FILE:
+        handlers.append(logging.FileHandler(settings.LOG_FILE))
+    
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler('app.log')
-        ]
+        handlers=handlers
     )
     
     return logging.getLogger(__name__)
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
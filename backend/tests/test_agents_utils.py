@@ -0,0 +1,40 @@
+import pytest
+
+from app.agents.utils import classify_query
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("select all rows from samples", "sql"),
+    ("plot glucose over time", "pandas"),
+    ("what does the protocol say about storage?", "rag"),
+])
+def test_classify_query_types(query, expected):
+    assert classify_query(query) == expected
+
+
+def test_sql_takes_priority_over_pandas():
+    # Pandas keyword appears first, SQL keyword later
+    assert classify_query("plot the values where temperature is high") == "sql"
+
+
+@pytest.mark.parametrize("query", ["SELECT *", "Group By region", "oRdEr By date"])
+def test_sql_keywords_are_case_insensitive(query):
+    assert classify_query(query) == "sql"
+
+
+@pytest.mark.parametrize("query", ["PLOT it", "Correlation between A and B", "Show a CHART"])
+def test_pandas_keywords_are_case_insensitive(query):
+    assert classify_query(query) == "pandas"
+
+
+def test_keywords_match_as_substrings():
+    # Matching is substring-based, so "selection" contains "select"
+    assert classify_query("describe the selection criteria") == "sql"
+    assert classify_query("show the plotted series") == "pandas"
+
+
+def test_overlapping_keywords_still_detect_sql():
+    # "statistics" and "select" share the "s"; a consuming match on the
+    # Pandas keyword would hide the SQL one
+    assert classify_query("statisticselect") == "sql"
+    assert classify_query("graphjoin") == "sql"
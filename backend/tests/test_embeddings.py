@@ -0,0 +1,66 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import embeddings
+from app.services.embeddings import EmbeddingService
+
+
+class FakeEmbeddingsAPI:
+    """Records each embeddings.create call and returns one-element vectors"""
+
+    def __init__(self):
+        self.calls = []
+
+    def create(self, input, model):
+        self.calls.append(list(input))
+        return SimpleNamespace(data=[
+            SimpleNamespace(index=i, embedding=[float(len(text))])
+            for i, text in enumerate(input)
+        ])
+
+
+@pytest.fixture
+def service():
+    # Skip __init__ so no API keys or network clients are needed
+    service = EmbeddingService.__new__(EmbeddingService)
+    service.openai_client = SimpleNamespace(embeddings=FakeEmbeddingsAPI())
+    return service
+
+
+def test_embed_batch_embeds_duplicates_once_and_preserves_order(service):
+    result = service.embed_batch(["aa", "b", "aa", "ccc"])
+
+    assert service.openai_client.embeddings.calls == [["aa", "b", "ccc"]]
+    assert result == [([2.0], "aa"), ([1.0], "b"), ([2.0], "aa"), ([3.0], "ccc")]
+
+
+def test_embed_batch_with_no_texts_makes_no_requests(service):
+    assert service.embed_batch([]) == []
+    assert service.openai_client.embeddings.calls == []
+
+
+def test_embed_batch_splits_on_input_count(service, monkeypatch):
+    monkeypatch.setattr(embeddings, "EMBEDDING_BATCH_SIZE", 2)
+
+    result = service.embed_batch(["a", "b", "c", "d", "e"])
+
+    assert service.openai_client.embeddings.calls == [["a", "b"], ["c", "d"], ["e"]]
+    assert [text for _, text in result] == ["a", "b", "c", "d", "e"]
+
+
+def test_embed_batch_splits_on_token_budget(service, monkeypatch):
+    # 20 chars ≈ 11 estimated tokens, so only two texts fit in a 25-token budget
+    monkeypatch.setattr(embeddings, "EMBEDDING_BATCH_TOKEN_BUDGET", 25)
+    texts = ["x" * 20, "y" * 20, "z" * 20]
+
+    result = service.embed_batch(texts)
+
+    assert service.openai_client.embeddings.calls == [texts[:2], texts[2:]]
+    assert [text for _, text in result] == texts
+
+
+def test_oversized_text_is_sent_alone():
+    batches = list(embeddings._iter_embedding_batches(["a", "x" * 2_000_000, "b"]))
+
+    assert batches == [["a"], ["x" * 2_000_000], ["b"]]
@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.agents.rag_agent import InvalidFilterError, RAGAgent
+from app.api import query as query_api
+from app.schemas.query import QueryRequest
+
+
+@pytest.fixture
+def agent():
+    # Skip __init__ so no embedding service or API keys are needed
+    return RAGAgent.__new__(RAGAgent)
+
+
+@pytest.mark.parametrize("filters", [None, {}])
+def test_no_filters_means_no_metadata_filter(agent, filters):
+    assert agent._build_metadata_filter(filters) is None
+
+
+def test_single_values_become_eq_conditions(agent):
+    result = agent._build_metadata_filter({"document_id": 3, "mime_type": "application/pdf"})
+
+    assert result == {"document_id": {"$eq": 3}, "mime_type": {"$eq": "application/pdf"}}
+
+
+def test_lists_become_in_conditions(agent):
+    result = agent._build_metadata_filter({"filename": ["a.pdf", "b.pdf"], "document_id": [1, 2]})
+
+    assert result == {"filename": {"$in": ["a.pdf", "b.pdf"]}, "document_id": {"$in": [1, 2]}}
+
+
+def test_unknown_key_is_rejected(agent):
+    with pytest.raises(InvalidFilterError, match="Unsupported filter keys: owner"):
+        agent._build_metadata_filter({"owner": "alice", "filename": "a.pdf"})
+
+
+@pytest.mark.parametrize("filters", [
+    {"document_id": "3"},
+    {"document_id": True},
+    {"document_id": [1, "2"]},
+    {"filename": 7},
+    {"mime_type": ["text/plain", 1]},
+    {"mime_type": {"$ne": "text/plain"}},
+])
+def test_value_of_wrong_type_is_rejected(agent, filters):
+    with pytest.raises(InvalidFilterError, match="must be a"):
+        agent._build_metadata_filter(filters)
+
+
+def test_empty_list_is_rejected(agent):
+    with pytest.raises(InvalidFilterError, match="non-empty list"):
+        agent._build_metadata_filter({"filename": []})
+
+
+def test_non_object_filters_are_rejected(agent):
+    with pytest.raises(InvalidFilterError, match="must be an object"):
+        agent._build_metadata_filter(["filename"])
+
+
+class FailingSupervisor:
+    def __init__(self, error):
+        self.error = error
+
+    async def process_query(self, query, context):
+        raise self.error
+
+
+@pytest.mark.parametrize("error, status_code", [
+    (InvalidFilterError("Unsupported filter keys: owner"), 400),
+    (RuntimeError("Pinecone unavailable"), 500),
+])
+def test_query_endpoint_maps_errors_to_status_codes(monkeypatch, error, status_code):
+    monkeypatch.setattr(query_api, "Supervisor", lambda: FailingSupervisor(error))
+    request = QueryRequest(query="what is in the report?", context={"filters": {"owner": "alice"}})
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(query_api.query_data(request))
+
+    assert exc_info.value.status_code == status_code
+    assert exc_info.value.detail == str(error)
@@ -13,18 +13,29 @@ if str(backend_dir) not in sys.path:
     sys.path.insert(0, str(backend_dir))
 
 import asyncio
-from app.services.embeddings import EmbeddingService  # pyright: ignore[reportMissingImports]
 from app.services.ingestion import IngestionService  # pyright: ignore[reportMissingImports]
 from app.models.db import get_db  # pyright: ignore[reportMissingImports]
 from app.models.documents import Document  # pyright: ignore[reportMissingImports]
 
+# Maximum number of documents re-indexed concurrently (bounded to respect embedding API rate limits)
+REINDEX_CONCURRENCY = 20
+
 async def reindex_all_documents():
     """Re-index all documents in Pinecone"""
     
-    embedding_service = EmbeddingService()
-    ingestion_service = IngestionService()
-    
     db = next(get_db())
+    ingestion_service = IngestionService(db)
+    semaphore = asyncio.Semaphore(REINDEX_CONCURRENCY)
+    
+    async def reindex_document(doc: Document):
+        async with semaphore:
+            print(f"Processing: {doc.filename}")
+            
+            # Embedding and upsert run in worker threads; session reads and the
+            # pinecone_id assignment stay on the event-loop thread
+            await ingestion_service._embed_and_store_chunks(doc.chunks, doc)
+            
+            print(f"✓ Completed: {doc.filename}")
     
     try:
         # Get all documents
@@ -32,19 +43,14 @@ async def reindex_all_documents():
         
         print(f"Re-indexing {len(documents)} documents...")
         
-        for doc in documents:
-            print(f"Processing: {doc.filename}")
-            
-            # Re-create chunks and embeddings
-            chunks = await ingestion_service._create_chunks(doc)
-            await ingestion_service._embed_chunks(chunks)
-            
-            print(f"✓ Completed: {doc.filename}")
+        await asyncio.gather(*(reindex_document(doc) for doc in documents))
+        db.commit()
         
         print("Re-indexing completed successfully!")
         
     except Exception as e:
         print(f"Error during re-indexing: {e}")
+        db.rollback()
     finally:
         db.close()
 
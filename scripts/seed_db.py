@@ -3,13 +3,23 @@
 Development script to populate sample metadata
 """
 
-import asyncio
+import sys
+from pathlib import Path
+
+# Ensure the backend directory is in the Python path for absolute imports
+backend_dir = (Path(__file__).resolve().parent.parent / "backend").resolve()
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import insert
 from sqlalchemy.orm import sessionmaker
-from app.models.db import engine, Base
-from app.models.documents import Document
-from app.models.datasets import Dataset
+from app.models.db import engine, Base  # pyright: ignore[reportMissingImports]
+from app.models.documents import Document  # pyright: ignore[reportMissingImports]
+# Chunk is imported so the mapper can resolve Document.chunks
+from app.models.chunks import Chunk  # noqa: F401  # pyright: ignore[reportMissingImports]
+from app.models.datasets import Dataset  # pyright: ignore[reportMissingImports]
 
-async def seed_database():
+def seed_database():
     """Populate database with sample data"""
     
     # Create tables
@@ -19,51 +29,45 @@ async def seed_database():
     db = SessionLocal()
     
     try:
-        # Sample documents
+        # Sample documents, inserted as plain rows in a single executemany
         sample_docs = [
-            Document(
-                filename="sales_data.csv",
-                file_path="/data/sales_data.csv",
-                content="Sample CSV content",
-                metadata={"type": "csv", "columns": ["date", "sales", "region"]},
-                file_size=1024,
-                mime_type="text/csv"
-            ),
-            Document(
-                filename="customer_data.json",
-                file_path="/data/customer_data.json",
-                content="Sample JSON content",
-                metadata={"type": "json", "structure": "nested"},
-                file_size=2048,
-                mime_type="application/json"
-            )
+            {
+                "filename": "sales_data.csv",
+                "storage_path": "/data/sales_data.csv",
+                "file_metadata": {"type": "csv", "columns": ["date", "sales", "region"]},
+                "file_size": 1024,
+                "mime_type": "text/csv"
+            },
+            {
+                "filename": "customer_data.json",
+                "storage_path": "/data/customer_data.json",
+                "file_metadata": {"type": "json", "structure": "nested"},
+                "file_size": 2048,
+                "mime_type": "application/json"
+            }
         ]
         
-        for doc in sample_docs:
-            db.add(doc)
-        
-        db.commit()
+        document_ids = db.scalars(insert(Document).returning(Document.id, sort_by_parameter_order=True), sample_docs).all()
         
         # Sample datasets
         sample_datasets = [
-            Dataset(
-                name="Sales Data",
-                description="Monthly sales data by region",
-                schema={
+            {
+                "name": "Sales Data",
+                "description": "Monthly sales data by region",
+                "schema": {
                     "columns": [
                         {"name": "date", "type": "date"},
                         {"name": "sales", "type": "float"},
                         {"name": "region", "type": "string"}
                     ]
                 },
-                source_file_id=1,
-                row_count=1000,
-                column_count=3
-            )
+                "source_file_id": document_ids[0],
+                "row_count": 1000,
+                "column_count": 3
+            }
         ]
         
-        for dataset in sample_datasets:
-            db.add(dataset)
+        db.execute(insert(Dataset), sample_datasets)
         
         db.commit()
         print("Database seeded successfully!")
@@ -75,4 +79,4 @@ async def seed_database():
         db.close()
 
 if __name__ == "__main__":
-    asyncio.run(seed_database())
+    seed_database()